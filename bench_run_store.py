@@ -0,0 +1,71 @@
+"""Benchmark do `RunStore`: débito de inserção e latência das consultas.
+
+Uso: python bench_run_store.py [--runs 1000000] [--levels 100] [--queries 1000]
+"""
+
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+
+from run_store import RunStore, level_hash
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def time_queries(query, levels, count, k):
+    """Executa `count` consultas em níveis aleatórios; retorna latências em ms."""
+    samples = []
+    for _ in range(count):
+        level = random.choice(levels)
+        start = time.perf_counter()
+        query(level, k)
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=1_000_000)
+    parser.add_argument("--levels", type=int, default=100)
+    parser.add_argument("--queries", type=int, default=1000)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--batch-size", type=int, default=5000)
+    args = parser.parse_args()
+
+    random.seed(0)
+    levels = [level_hash([f"level {i}"]) for i in range(args.levels)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = RunStore(os.path.join(tmp, "runs.db"), batch_size=args.batch_size)
+
+        # generate first so only enqueue + write time is measured
+        runs = [(random.choice(levels), random.randint(0, 50), random.random() < 0.3,
+                 random.randint(600, 36000)) for _ in range(args.runs)]
+
+        start = time.perf_counter()
+        for run in runs:
+            store.record(*run)
+        enqueued = time.perf_counter() - start
+        store.flush()
+        elapsed = time.perf_counter() - start
+
+        print(f"runs: {args.runs}, levels: {args.levels}, batch size: {args.batch_size}")
+        print(f"enqueue: {enqueued:.2f}s ({enqueued / args.runs * 1e6:.2f} us/run on the caller)")
+        print(f"insert:  {elapsed:.2f}s ({args.runs / elapsed:,.0f} runs/s until flushed)")
+
+        for name, query in (("top_scores", store.top_scores), ("fastest_wins", store.fastest_wins)):
+            samples = time_queries(query, levels, args.queries, args.k)
+            print(f"{name}: p50 {statistics.median(samples):.3f} ms, "
+                  f"p99 {percentile(samples, 99):.3f} ms, max {max(samples):.3f} ms")
+
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
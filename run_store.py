@@ -0,0 +1,153 @@
+import hashlib
+import queue
+import sqlite3
+import threading
+import time
+
+# Runs reference levels by integer id: indexing the 40-char hash directly
+# makes every insert noticeably slower once the table is large.
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS levels (
+    id INTEGER PRIMARY KEY,
+    hash TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    level_id INTEGER NOT NULL REFERENCES levels (id),
+    score INTEGER NOT NULL,
+    won INTEGER NOT NULL,
+    frames INTEGER NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_runs_level_score
+    ON runs (level_id, score DESC, frames);
+CREATE INDEX IF NOT EXISTS idx_runs_level_fastest_win
+    ON runs (level_id, frames) WHERE won = 1;
+"""
+
+_INSERT = ("INSERT INTO runs (level_id, score, won, frames, created_at) "
+           "VALUES (?, ?, ?, ?, ?)")
+
+# Sentinel that tells the writer thread to stop
+_STOP = object()
+
+
+def level_hash(rows):
+    """Retorna o hash (sha1 hex) da grelha `rows`, usado como chave do nível."""
+
+    return hashlib.sha1("\n".join(rows).encode("utf-8")).hexdigest()
+
+
+class RunStore:
+    """Registo local de partidas em SQLite, indexado por hash do nível.
+
+    `record` só coloca a partida numa fila; uma thread de escrita agrupa as
+    inserções em transações de até `batch_size` linhas, por isso o loop do
+    jogo nunca espera pelo disco.
+    """
+
+    def __init__(self, path, batch_size=5000):
+        self.path = path
+        self.batch_size = batch_size
+        self._queue = queue.Queue()
+        self._closed = False
+        # guards `_closed` so no run can be queued behind the stop sentinel
+        self._lock = threading.Lock()
+
+        # schema is created up front so queries work before the first write
+        self._reader = self._connect()
+        self._reader.executescript(_SCHEMA)
+        # opened here rather than in the writer thread, so a locked or
+        # unreadable database fails in the caller instead of killing the
+        # writer silently and leaving record()/flush() queueing forever
+        try:
+            self._writer_conn = self._connect(check_same_thread=False)
+        except sqlite3.Error:
+            self._reader.close()
+            raise
+
+        self._writer = threading.Thread(target=self._write_loop, name="run-store-writer", daemon=True)
+        self._writer.start()
+
+    def _connect(self, check_same_thread=True):
+        conn = sqlite3.connect(self.path, timeout=30, check_same_thread=check_same_thread)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def record(self, level, score, won, frames):
+        """Enfileira uma partida (não bloqueia).
+
+        Lança RuntimeError se o registo já foi fechado.
+        """
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("RunStore is closed")
+            self._queue.put((level, int(score), int(bool(won)), int(frames), time.time()))
+
+    def flush(self):
+        """Espera até todas as partidas enfileiradas estarem gravadas."""
+        self._queue.join()
+
+    def close(self):
+        """Grava o que falta, termina a thread de escrita e fecha a base."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(_STOP)
+        self._writer.join()
+        self._reader.close()
+
+    def _write_loop(self):
+        conn = self._writer_conn
+        level_ids = {}
+        running = True
+        while running:
+            # block for the first item, then drain whatever else is queued
+            batch = [self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            rows = [item for item in batch if item is not _STOP]
+            running = len(rows) == len(batch)
+            try:
+                if rows:
+                    with conn:
+                        conn.executemany(_INSERT, [(self._level_id(conn, level_ids, level), *rest)
+                                                   for level, *rest in rows])
+            except sqlite3.Error as exc:
+                level_ids.clear()
+                print(f"Run store: failed to write {len(rows)} runs: {exc}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+        conn.close()
+
+    @staticmethod
+    def _level_id(conn, level_ids, level):
+        if level not in level_ids:
+            conn.execute("INSERT OR IGNORE INTO levels (hash) VALUES (?)", (level,))
+            level_ids[level] = conn.execute("SELECT id FROM levels WHERE hash = ?", (level,)).fetchone()[0]
+        return level_ids[level]
+
+    def top_scores(self, level, k=10):
+        """Retorna as `k` melhores partidas do nível: [(score, won, frames, created_at)]."""
+        return self._reader.execute(
+            "SELECT score, won, frames, created_at FROM runs "
+            "WHERE level_id = (SELECT id FROM levels WHERE hash = ?) "
+            "ORDER BY score DESC, frames LIMIT ?",
+            (level, k),
+        ).fetchall()
+
+    def fastest_wins(self, level, k=10):
+        """Retorna as `k` vitórias mais rápidas do nível: [(frames, score, created_at)]."""
+        return self._reader.execute(
+            "SELECT frames, score, created_at FROM runs "
+            "WHERE level_id = (SELECT id FROM levels WHERE hash = ?) AND won = 1 "
+            "ORDER BY frames LIMIT ?",
+            (level, k),
+        ).fetchall()
@@ -1,9 +1,12 @@
 import os
 import ast
+import atexit
 import re
 import pygame
+from collections import OrderedDict
 from os import listdir
 from os.path import isfile, join
+from run_store import RunStore, level_hash
 pygame.init()
 
 pygame.display.set_caption("Platformer")
@@ -12,16 +15,50 @@ WIDTH, HEIGHT = 1200, 710
 FPS = 60
 PLAYER_VEL = 5
 
+# Dev mode: watch map.txt and apply edits without restarting (HOT_RELOAD=1)
+HOT_RELOAD = os.environ.get("HOT_RELOAD", "0") == "1"
+
+# Optional low-resolution render target: the scene is composed at
+# 1/RENDER_SCALE of the window size and upscaled once per frame.
+# RENDER_SMOOTH=1 uses smoothscale for the upscale instead of nearest.
+try:
+    RENDER_SCALE = max(1, int(os.environ.get("RENDER_SCALE", "1")))
+except ValueError:
+    RENDER_SCALE = 1
+RENDER_SMOOTH = os.environ.get("RENDER_SMOOTH", "0") == "1"
+
+# SQLite file where finished runs are recorded, relative to this script;
+# off by default, meant for headless/replayed batch sessions (RUN_STORE=runs.db)
+RUN_STORE = os.environ.get("RUN_STORE", "")
+
 window = pygame.display.set_mode((WIDTH, HEIGHT))
 
+# Fonts, cached by size so overlays don't create a new SysFont each time
+_FONT_CACHE = {}
+
+
+def get_font(size):
+    """Retorna a fonte do sistema com tamanho `size` (cacheada)."""
+
+    if size not in _FONT_CACHE:
+        _FONT_CACHE[size] = pygame.font.SysFont(None, size)
+    return _FONT_CACHE[size]
+
+
 # Font for HUD
-FONT = pygame.font.SysFont(None, 36)
+FONT = get_font(36)
 
 # Caches to avoid repeated image loads / transforms
 _BLOCK_CACHE = {}
+_BLOCK_TILE_CACHE = {}
 _END_CACHE = {}
 _COLLECTIBLE_CACHE = {}
 _ENEMY_CACHE = {}
+# Native (1x) source art for surfaces upscaled at load time (only kept when
+# RENDER_SCALE > 1, and released once its low-res copy is built), and the
+# downscaled copies used by LowResRenderer, keyed by (surface, scale)
+_NATIVE_SURFACES = {}
+_LOWRES_CACHE = {}
 
 
 def flip(sprites):
@@ -52,11 +89,18 @@ def load_sprite_sheets(dir1, dir2, width, height, direction=False):
             surface = pygame.Surface((width, height), pygame.SRCALPHA, 32)
             rect = pygame.Rect(i * width, 0, width, height)
             surface.blit(sprite_sheet, (0, 0), rect)
-            sprites.append(pygame.transform.scale2x(surface))
+            scaled = pygame.transform.scale2x(surface)
+            if RENDER_SCALE > 1:
+                _NATIVE_SURFACES[scaled] = surface
+            sprites.append(scaled)
 
         if direction:
             all_sprites[image.replace(".png", "") + "_right"] = sprites
-            all_sprites[image.replace(".png", "") + "_left"] = flip(sprites)
+            flipped = flip(sprites)
+            if RENDER_SCALE > 1:
+                for sprite, flipped_sprite in zip(sprites, flipped):
+                    _NATIVE_SURFACES[flipped_sprite] = pygame.transform.flip(_NATIVE_SURFACES[sprite], True, False)
+            all_sprites[image.replace(".png", "") + "_left"] = flipped
         else:
             all_sprites[image.replace(".png", "")] = sprites
 
@@ -78,10 +122,75 @@ def get_block(size):
     rect = pygame.Rect(96, 0, size, size)
     surface.blit(image, (0, 0), rect)
     scaled = pygame.transform.scale2x(surface)
+    if RENDER_SCALE > 1:
+        _NATIVE_SURFACES[scaled] = surface
     _BLOCK_CACHE[size] = scaled
     return scaled
 
 
+def get_lowres_surface(surface, scale):
+    """Retorna `surface` reduzida por `scale` para o render em baixa resolução.
+
+    Usa a arte original (1x) quando a surface foi ampliada no carregamento;
+    o resultado fica em cache para não repetir transforms a cada frame.
+    """
+
+    key = (surface, scale)
+    if key in _LOWRES_CACHE:
+        return _LOWRES_CACHE[key]
+
+    # round up so neighbouring tiles overlap instead of leaving seams when
+    # the size is not a multiple of `scale`
+    width, height = surface.get_size()
+    size = (max(1, -(-width // scale)), max(1, -(-height // scale)))
+    native = _NATIVE_SURFACES.pop(surface, None)
+    if native is not None and native.get_size() == size:
+        small = native
+    else:
+        small = pygame.transform.scale(native if native is not None else surface, size)
+    _LOWRES_CACHE[key] = small
+    return small
+
+
+class LowResRenderer:
+    """Alvo de render interno em baixa resolução, ampliado uma vez por frame.
+
+    Expõe `blit(source, dest)` com coordenadas de ecrã em tamanho real, por
+    isso os métodos `draw` dos objetos funcionam sem alterações; posições e
+    sprites são reduzidos por `scale` ao compor a cena.
+
+    A ampliação usa sempre o mesmo fator `scale` nos dois eixos; se o tamanho
+    da janela não for múltiplo de `scale`, o alvo interno é arredondado para
+    cima e o excesso (menos de `scale` píxeis) fica fora da janela.
+    """
+
+    def __init__(self, window, scale=2, smooth=False):
+        self.window = window
+        self.scale = scale
+        self.smooth = smooth
+        width, height = window.get_size()
+        self.surface = pygame.Surface((-(-width // scale), -(-height // scale))).convert()
+        # intermediate target when the upscaled size overshoots the window
+        upscaled = (self.surface.get_width() * scale, self.surface.get_height() * scale)
+        self.upscaled = None if upscaled == (width, height) else pygame.Surface(upscaled).convert()
+
+    def blit(self, source, dest):
+        x, y = dest[0], dest[1]
+        small = get_lowres_surface(source, self.scale)
+        self.surface.blit(small, (x // self.scale, y // self.scale))
+
+    def present(self):
+        """Amplia a cena composta para a janela (um único passo de escala)."""
+        target = self.upscaled if self.upscaled else self.window
+        size = target.get_size()
+        if self.smooth:
+            pygame.transform.smoothscale(self.surface, size, target)
+        else:
+            pygame.transform.scale(self.surface, size, target)
+        if self.upscaled:
+            self.window.blit(self.upscaled, (0, 0))
+
+
 class Player(pygame.sprite.Sprite):
     """Representa o jogador — controla movimento, física e sprite/estado.
 
@@ -208,8 +317,12 @@ class Block(Object):
     def __init__(self, x, y, size):
         """Bloco de terreno: desenha o tile de terreno dentro de seu `image`."""
         super().__init__(x, y, size, size)
-        block = get_block(size)
-        self.image.blit(block, (0, 0))
+        # every block of a given size shares one tile surface, so the
+        # low-resolution copy is also built only once per size
+        if size not in _BLOCK_TILE_CACHE:
+            self.image.blit(get_block(size), (0, 0))
+            _BLOCK_TILE_CACHE[size] = self.image
+        self.image = _BLOCK_TILE_CACHE[size]
         self.mask = pygame.mask.from_surface(self.image)
 
 
@@ -359,31 +472,161 @@ def get_background(name):
     return tiles, image
 
 
-def draw(window, background, bg_image, player, objects, offset_x):
-    """Desenha o background, objetos, jogador e HUD (pontuação)."""
+class TextCache:
+    """Cache LRU de texto renderizado, indexado por (fonte, texto, cor).
+
+    Evita chamar `font.render` a cada frame para textos que não mudaram.
+    """
+
+    def __init__(self, max_size=64):
+        self.max_size = max_size
+        self._surfaces = OrderedDict()
+
+    def render(self, font, text, color):
+        key = (font, text, tuple(color))
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            return surface
+
+        surface = font.render(text, True, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_size:
+            self._surfaces.popitem(last=False)
+        return surface
+
+
+TEXT_CACHE = TextCache()
+
+
+class HudLabel:
+    """Texto do HUD ligado a um valor; só é re-renderizado quando o valor muda."""
+
+    _UNSET = object()
+
+    def __init__(self, fmt, pos, font=None, color=(255, 255, 255)):
+        self.fmt = fmt
+        self.pos = pos
+        self.font = font or FONT
+        self.color = color
+        self.value = self._UNSET
+        self.surface = None
+        self.rect = pygame.Rect(pos, (0, 0))
+
+    def set_value(self, value):
+        """Atualiza o valor; retorna a região suja (Rect) ou None se não mudou."""
+        if value == self.value:
+            return None
+
+        self.value = value
+        old_rect = self.rect
+        self.surface = TEXT_CACHE.render(self.font, self.fmt.format(value), self.color)
+        self.rect = self.surface.get_rect(topleft=self.pos)
+        return old_rect.union(self.rect)
+
+    def draw(self, win):
+        if self.surface is not None:
+            win.blit(self.surface, self.rect)
+
+
+class Hud:
+    """Camada de UI retida: widgets com nome e as regiões sujas pendentes.
+
+    `draw` volta a pôr todos os widgets porque a cena por baixo é repintada a
+    cada frame; custa só um blit por widget, já que o texto está em cache.
+    `dirty_rects` acumula as áreas que mudaram desde o último `draw`, para
+    quem desenhe sobre um fundo estático e só precise de atualizar essas
+    regiões do ecrã.
+    """
+
+    def __init__(self):
+        self.widgets = {}
+        self.dirty_rects = []
+
+    def add(self, name, widget):
+        self.widgets[name] = widget
+        return widget
+
+    def set(self, name, value):
+        rect = self.widgets[name].set_value(value)
+        if rect is not None:
+            self.dirty_rects.append(rect)
+
+    def draw(self, win):
+        """Desenha os widgets e retorna (e limpa) as regiões sujas."""
+        for widget in self.widgets.values():
+            widget.draw(win)
+        dirty, self.dirty_rects = self.dirty_rects, []
+        return dirty
+
+
+HUD = Hud()
+HUD.add("score", HudLabel("Score: {}", (10, 10)))
+
+
+def draw(window, background, bg_image, player, objects, offset_x, renderer=None):
+    """Desenha o background, objetos, jogador e HUD (pontuação).
+
+    Com `renderer` (um `LowResRenderer`), a cena é composta em baixa
+    resolução e ampliada para `window`; o HUD é desenhado depois, nítido.
+    """
+
+    target = renderer if renderer else window
 
     for tile in background:
-        window.blit(bg_image, tile)
+        target.blit(bg_image, tile)
 
     for obj in objects:
-        obj.draw(window, offset_x)
+        obj.draw(target, offset_x)
 
-    player.draw(window, offset_x)
+    player.draw(target, offset_x)
 
-    # Draw score HUD
-    try:
-        score_text = FONT.render(f"Score: {player.score}", True, (255, 255, 255))
-        window.blit(score_text, (10, 10))
-    except Exception:
-        pass
+    if renderer:
+        renderer.present()
+
+    # Draw score HUD (re-rendered only when the score changes)
+    HUD.set("score", player.score)
+    HUD.draw(window)
 
     pygame.display.update()
 
 
+# Composed win/lose screens, keyed by (kind, background, trophy)
+_OVERLAY_CACHE = {}
+
+
+def compose_overlay(kind, bg_image, title, title_color, subtitle, trophy=None):
+    """Compõe uma única vez a tela de fim (fundo, véu escuro, troféu e textos)."""
+
+    key = (kind, bg_image, trophy)
+    if key in _OVERLAY_CACHE:
+        return _OVERLAY_CACHE[key]
+
+    screen = pygame.Surface((WIDTH, HEIGHT)).convert()
+    screen.blit(bg_image, (0, 0))
+
+    overlay = pygame.Surface((WIDTH, HEIGHT))
+    overlay.fill((0, 0, 0))
+    overlay.set_alpha(200)
+    screen.blit(overlay, (0, 0))
+
+    if trophy:
+        tw, th = trophy.get_size()
+        tx = (WIDTH - tw) // 2
+        ty = HEIGHT // 4
+        screen.blit(trophy, (tx, ty))
+
+    text = TEXT_CACHE.render(get_font(72), title, title_color)
+    sub = TEXT_CACHE.render(get_font(36), subtitle, (255, 255, 255))
+    screen.blit(text, ((WIDTH - text.get_width()) // 2, HEIGHT // 2))
+    screen.blit(sub, ((WIDTH - sub.get_width()) // 2, HEIGHT // 2 + 80))
+
+    _OVERLAY_CACHE[key] = screen
+    return screen
+
+
 def show_win_screen(window, bg_image, objects):
     """Mostra uma tela de vitória com o troféu e espera por tecla para sair."""
-    font = pygame.font.SysFont(None, 72)
-    small = pygame.font.SysFont(None, 36)
 
     # Find trophy image from objects if present
     trophy = None
@@ -392,11 +635,11 @@ def show_win_screen(window, bg_image, objects):
             trophy = obj.image
             break
 
-    overlay = pygame.Surface((WIDTH, HEIGHT))
-    overlay.fill((0, 0, 0))
-    overlay.set_alpha(200)
+    screen = compose_overlay("win", bg_image, "You Win!", (255, 215, 0),
+                             "Press any key to exit", trophy)
 
     waiting = True
+    redraw = True
     clock = pygame.time.Clock()
     while waiting:
         for event in pygame.event.get():
@@ -405,67 +648,54 @@ def show_win_screen(window, bg_image, objects):
                 quit()
             if event.type == pygame.KEYDOWN:
                 waiting = False
-
-        window.blit(bg_image, (0, 0))
-        window.blit(overlay, (0, 0))
-
-        if trophy:
-            tw, th = trophy.get_size()
-            tx = (WIDTH - tw) // 2
-            ty = HEIGHT // 4
-            window.blit(trophy, (tx, ty))
-
-        text = font.render("You Win!", True, (255, 215, 0))
-        sub = small.render("Press any key to exit", True, (255, 255, 255))
-        window.blit(text, ((WIDTH - text.get_width()) // 2, HEIGHT // 2))
-        window.blit(sub, ((WIDTH - sub.get_width()) // 2, HEIGHT // 2 + 80))
-
-        pygame.display.update()
+            if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                redraw = True
+
+        # the screen is static, so only present it when it was invalidated
+        if redraw:
+            window.blit(screen, (0, 0))
+            pygame.display.update()
+            redraw = False
         clock.tick(30)
 
 
 def show_lose_screen(window, bg_image, objects):
     """Mostra uma tela de derrota e espera por tecla para sair."""
-    font = pygame.font.SysFont(None, 72)
-    small = pygame.font.SysFont(None, 36)
 
-    overlay = pygame.Surface((WIDTH, HEIGHT))
-    overlay.fill((0, 0, 0))
-    overlay.set_alpha(200)
+    screen = compose_overlay("lose", bg_image, "You Lost!", (220, 20, 60),
+                             "Press any key to restart or close window to quit")
 
-    waiting = True
+    redraw = True
     clock = pygame.time.Clock()
     # Return True to restart level, False to quit
-    while waiting:
+    while True:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 return False
             if event.type == pygame.KEYDOWN:
                 # any key restarts the level
                 return True
-
-        window.blit(bg_image, (0, 0))
-        window.blit(overlay, (0, 0))
-
-        text = font.render("You Lost!", True, (220, 20, 60))
-        sub = small.render("Press any key to restart or close window to quit", True, (255, 255, 255))
-        window.blit(text, ((WIDTH - text.get_width()) // 2, HEIGHT // 2))
-        window.blit(sub, ((WIDTH - sub.get_width()) // 2, HEIGHT // 2 + 80))
-
-        pygame.display.update()
+            if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                redraw = True
+
+        # the screen is static, so only present it when it was invalidated
+        if redraw:
+            window.blit(screen, (0, 0))
+            pygame.display.update()
+            redraw = False
         clock.tick(30)
 
 
-def load_level(path, block_size):
-    """Carrega um nível a partir de `path` e retorna (player_pos, objects).
+def parse_level_rows(path):
+    """Lê `path` e retorna a lista de linhas (strings) da grelha do nível.
 
     Suporta formatos: uma grelha simples de caracteres, linhas entre aspas
     ou um literal Python `[...]` (ex.: `MAPA_LONGO = ["....", ...]`).
-    Símbolos: `P` jogador, `B`/`#` bloco, `F` fim, `Q` colecionável, `E` inimigo.
+    Retorna None se o ficheiro não existir.
     """
 
     if not os.path.exists(path):
-        return None, []
+        return None
 
     with open(path, "r", encoding="utf-8") as f:
         text = f.read()
@@ -491,10 +721,56 @@ def load_level(path, block_size):
         else:
             rows = [line.rstrip("\n") for line in text.splitlines() if line.strip() != ""]
 
+    return rows
+
+
+def create_cell_object(ch, x, y, block_size, path):
+    """Cria o objeto do nível para o símbolo `ch` na célula em (`x`, `y`).
+
+    Retorna None para células vazias e para `P` (o jogador é tratado à parte).
+    """
+
+    project_root = os.path.dirname(os.path.abspath(path))
+    if ch in ("B", "#"):
+        return Block(x, y, block_size)
+    if ch == "F":
+        # Create an end/trophy at this cell. Use project-relative asset if available.
+        trophy_path = os.path.join(project_root, "assets", "Items", "Checkpoints", "End", "End (Idle).png")
+        return End(x, y, block_size, image_path=trophy_path)
+    if ch == "Q":
+        # Create a collectible centered in the cell
+        csize = block_size // 2
+        cx = x + (block_size - csize) // 2
+        cy = y + (block_size - csize) // 2
+        collect_path = os.path.join(project_root, "assets", "Traps", "Spiked Ball", "Spiked Ball.png")
+        return Collectible(cx, cy, csize, image_path=collect_path)
+    if ch == "E":
+        # Create an enemy in this cell with a 2-block patrol
+        esize = block_size
+        enemy_path = os.path.join(project_root, "assets", "Traps", "Spike Head", "Idle.png")
+        enemy = Enemy(x, y, esize, image_path=enemy_path)
+        # set patrol distance to 2 blocks and a moderate speed
+        enemy.patrol_distance = block_size * 2
+        enemy.speed = 2
+        enemy.start_x = x
+        return enemy
+    return None
+
+
+def build_level(rows, block_size, path):
+    """Instancia a grelha `rows` e retorna (player_pos, objects, cells).
+
+    `cells` mapeia (linha a contar de baixo, coluna) para o objeto criado
+    nessa célula, o que permite recriar apenas as células alteradas (ver
+    `LevelWatcher`). O nível é ancorado ao fundo do ecrã, por isso a posição
+    de uma célula só depende da sua linha a contar de baixo.
+    """
+
     level_height = len(rows)
     base_y = HEIGHT - level_height * block_size
 
     objects = []
+    cells = {}
     player_pos = None
 
     for row_i, row in enumerate(rows):
@@ -503,38 +779,191 @@ def load_level(path, block_size):
             y = base_y + row_i * block_size
             if ch == "P":
                 player_pos = (x, y)
-            elif ch in ("B", "#"):
-                objects.append(Block(x, y, block_size))
-            elif ch == "F":
-                # Create an end/trophy at this cell. Use project-relative asset if available.
-                project_root = os.path.dirname(os.path.abspath(path))
-                trophy_path = os.path.join(project_root, "assets", "Items", "Checkpoints", "End", "End (Idle).png")
-                end_obj = End(x, y, block_size, image_path=trophy_path)
-                objects.append(end_obj)
-            elif ch == "Q":
-                # Create a collectible centered in the cell
-                csize = block_size // 2
-                cx = x + (block_size - csize) // 2
-                cy = y + (block_size - csize) // 2
-                project_root = os.path.dirname(os.path.abspath(path))
-                collect_path = os.path.join(project_root, "assets", "Traps", "Spiked Ball", "Spiked Ball.png")
-                col = Collectible(cx, cy, csize, image_path=collect_path)
-                objects.append(col)
-            elif ch == "E":
-                # Create an enemy in this cell with a 2-block patrol
-                esize = block_size
-                project_root = os.path.dirname(os.path.abspath(path))
-                enemy_path = os.path.join(project_root, "assets", "Traps", "Spike Head", "Idle.png")
-                enemy = Enemy(x, y, esize, image_path=enemy_path)
-                # set patrol distance to 2 blocks and a moderate speed
-                enemy.patrol_distance = block_size * 2
-                enemy.speed = 2
-                enemy.start_x = x
-                objects.append(enemy)
+                continue
+            obj = create_cell_object(ch, x, y, block_size, path)
+            if obj is not None:
+                objects.append(obj)
+                cells[(level_height - 1 - row_i, col_i)] = obj
+
+    return player_pos, objects, cells
 
+
+def load_level(path, block_size):
+    """Carrega um nível a partir de `path` e retorna (player_pos, objects).
+
+    Símbolos: `P` jogador, `B`/`#` bloco, `F` fim, `Q` colecionável, `E` inimigo.
+    """
+
+    rows = parse_level_rows(path)
+    if rows is None:
+        return None, []
+
+    player_pos, objects, _ = build_level(rows, block_size, path)
     return player_pos, objects
 
 
+class LevelWatcher:
+    """Recarrega `map.txt` em modo de desenvolvimento quando o ficheiro muda.
+
+    Compara as novas linhas com a grelha carregada e recria apenas os objetos
+    das células alteradas; o jogador e o resto do estado do nível ficam como
+    estão.
+    """
+
+    def __init__(self, path, block_size, check_interval=30):
+        self.path = path
+        self.block_size = block_size
+        self.check_interval = check_interval
+        self.rows = []
+        self.cells = {}
+        self.mtime = None
+        self.frame = 0
+
+    def load(self):
+        """Carga completa do nível; retorna (player_pos, objects)."""
+        self.mtime = self._stat()
+        rows = parse_level_rows(self.path)
+        if rows is None:
+            self.rows, self.cells = [], {}
+            return None, []
+
+        player_pos, objects, self.cells = build_level(rows, self.block_size, self.path)
+        self.rows = list(rows)
+        return player_pos, objects
+
+    def _stat(self):
+        try:
+            return os.stat(self.path).st_mtime_ns
+        except OSError:
+            return None
+
+    def poll(self, objects, player=None):
+        """Verifica o ficheiro a cada `check_interval` frames.
+
+        Se mudou, aplica a diferença a `objects` (in-place) e retorna True.
+        Se ainda não havia grelha carregada, substitui `objects` pelo nível.
+        """
+
+        self.frame += 1
+        if self.frame % self.check_interval:
+            return False
+
+        mtime = self._stat()
+        if mtime is None or mtime == self.mtime:
+            return False
+
+        try:
+            rows = parse_level_rows(self.path)
+        except (OSError, UnicodeDecodeError):
+            # editor may still be writing the file; retry on next poll
+            return False
+        if self._stat() != mtime:
+            # modified while we were reading it; retry on next poll
+            return False
+        self.mtime = mtime
+
+        if not rows:
+            # an empty grid is most likely a truncated save; wait for the
+            # next change instead of wiping the level
+            print(f"Ignored map reload: {self.path}, rows=0")
+            return False
+
+        if not self.rows:
+            # nothing was loaded from the map (main fell back to the demo
+            # objects), so there is no grid to diff against
+            _, map_objects = self.load()
+            objects[:] = map_objects
+            print(f"Loaded map: {self.path}, objects={len(map_objects)}")
+            return True
+
+        self.apply(rows, objects, player)
+        return True
+
+    @staticmethod
+    def _row_at(rows, b):
+        return rows[b] if 0 <= b < len(rows) else ""
+
+    def _row_shift(self, old, new):
+        """Deslocamento (em linhas a contar de baixo) que melhor alinha `old` com `new`.
+
+        Linhas acrescentadas/removidas no topo não mexem nas restantes (0);
+        no fundo, todas as linhas antigas sobem ou descem (a diferença de
+        altura). Escolhe o que deixa menos linhas diferentes.
+        """
+
+        delta = len(new) - len(old)
+        if delta == 0:
+            return 0
+
+        def changed_rows(shift):
+            # old rows pushed below the bottom (shift < 0) are removed too
+            dropped = max(0, -shift)
+            return dropped + sum(self._row_at(old, b - shift) != self._row_at(new, b)
+                                 for b in range(max(len(old) + shift, len(new))))
+
+        return min((0, delta), key=changed_rows)
+
+    def apply(self, rows, objects, player=None):
+        """Aplica as novas `rows` a `objects`, tocando só nas células alteradas.
+
+        As linhas são comparadas a contar de baixo; se a grelha cresceu ou
+        encolheu pelo fundo, os objetos existentes (e `player`) são deslocados
+        em vez de recriados.
+        """
+
+        old = self.rows[::-1]
+        new = rows[::-1]
+        removed = set()
+
+        shift = self._row_shift(old, new)
+        if shift:
+            dy = -shift * self.block_size
+            cells = {}
+            for (b, c), obj in self.cells.items():
+                if b + shift < 0:
+                    # row dropped from the bottom of the grid
+                    removed.add(obj)
+                    continue
+                obj.rect.y += dy
+                cells[(b + shift, c)] = obj
+            self.cells = cells
+            if player is not None:
+                player.rect.y += dy
+            old = [""] * shift + old if shift > 0 else old[-shift:]
+
+        changed = []
+        for b in range(max(len(old), len(new))):
+            old_row = self._row_at(old, b)
+            new_row = self._row_at(new, b)
+            if old_row == new_row:
+                continue
+            for c in range(max(len(old_row), len(new_row))):
+                old_ch = old_row[c] if c < len(old_row) else "."
+                new_ch = new_row[c] if c < len(new_row) else "."
+                if old_ch != new_ch:
+                    changed.append((b, c, new_ch))
+
+        added = []
+        for b, c, ch in changed:
+            old_obj = self.cells.pop((b, c), None)
+            if old_obj is not None:
+                removed.add(old_obj)
+
+            x = c * self.block_size
+            y = HEIGHT - (b + 1) * self.block_size
+            obj = create_cell_object(ch, x, y, self.block_size, self.path)
+            if obj is not None:
+                self.cells[(b, c)] = obj
+                added.append(obj)
+
+        if removed:
+            objects[:] = [obj for obj in objects if obj not in removed]
+        objects.extend(added)
+        self.rows = list(rows)
+
+        print(f"Reloaded map: {self.path}, changed_cells={len(changed)}, row_shift={shift}")
+
+
 def handle_vertical_collision(player, objects, dy):
     """Verifica colisões verticais do `player` com `objects`.
 
@@ -615,21 +1044,44 @@ def handle_move(player, objects):
             player.dead = True
 
 
+def level_bounds(objects):
+    """Retorna os limites horizontais (min_x, max_x) do nível a partir de `objects`."""
+
+    if objects:
+        return min(obj.rect.left for obj in objects), max(obj.rect.right for obj in objects)
+    return 0, WIDTH
+
+
 def main(window):
     """Função principal: inicializa o nível, loop do jogo e trata encerramento."""
 
     clock = pygame.time.Clock()
     background, bg_image = get_background("Blue.png")
+    renderer = LowResRenderer(window, RENDER_SCALE, RENDER_SMOOTH) if RENDER_SCALE > 1 else None
 
     block_size = 96
 
     # Resolve map path relative to this script so it loads correctly
     script_dir = os.path.dirname(os.path.abspath(__file__))
     map_path = os.path.join(script_dir, "map.txt")
-    player_start, map_objects = load_level(map_path, block_size)
+    watcher = LevelWatcher(map_path, block_size) if HOT_RELOAD else None
+    if watcher:
+        player_start, map_objects = watcher.load()
+        level_rows = watcher.rows
+    else:
+        level_rows = parse_level_rows(map_path) or []
+        player_start, map_objects, _ = build_level(level_rows, block_size, map_path)
 
     print(f"Loaded map: {map_path}, player_start={player_start}, objects={len(map_objects)}")
 
+    # Finished runs are queued to a background writer, never written inline
+    run_store = None
+    if RUN_STORE:
+        run_store = RunStore(os.path.join(script_dir, RUN_STORE))
+        atexit.register(run_store.close)
+    level_key = level_hash(level_rows)
+    frames = 0
+
     if player_start:
         player = Player(player_start[0], player_start[1], 50, 50)
     else:
@@ -647,12 +1099,7 @@ def main(window):
                    Block(block_size * 3, HEIGHT - block_size * 4, block_size), fire]
 
     # compute level horizontal bounds from objects
-    if objects:
-        min_x = min(obj.rect.left for obj in objects)
-        max_x = max(obj.rect.right for obj in objects)
-    else:
-        min_x = 0
-        max_x = WIDTH
+    min_x, max_x = level_bounds(objects)
     level_width = max_x - min_x
 
     offset_x = 0
@@ -671,6 +1118,12 @@ def main(window):
                 if event.key == pygame.K_SPACE and player.jump_count < 2:
                     player.jump()
 
+        # Dev mode: apply map.txt edits to the live level
+        if watcher and watcher.poll(objects, player):
+            min_x, max_x = level_bounds(objects)
+            level_width = max_x - min_x
+            level_key = level_hash(watcher.rows)
+
         player.loop(FPS)
         for obj in objects:
             if hasattr(obj, "loop"):
@@ -678,6 +1131,11 @@ def main(window):
 
         # handle input / movement once per frame
         handle_move(player, objects)
+        frames += 1
+
+        # Record finished runs (win, enemy hit or fall)
+        if run_store and (player.won or player.dead or player.rect.top > HEIGHT):
+            run_store.record(level_key, player.score, player.won, frames)
 
         # Enemy collision -> immediate loss
         if getattr(player, "dead", False):
@@ -690,20 +1148,22 @@ def main(window):
             restart = show_lose_screen(window, bg_image, objects)
             if restart:
                 # reload level fresh
-                player_start, map_objects = load_level(map_path, block_size)
+                if watcher:
+                    player_start, map_objects = watcher.load()
+                    level_rows = watcher.rows
+                else:
+                    level_rows = parse_level_rows(map_path) or []
+                    player_start, map_objects, _ = build_level(level_rows, block_size, map_path)
+                level_key = level_hash(level_rows)
                 if player_start:
                     player = Player(player_start[0], player_start[1], 50, 50)
                 else:
                     player = Player(100, 100, 50, 50)
                 objects = map_objects if map_objects else objects
                 offset_x = 0
+                frames = 0
                 # recompute level bounds
-                if objects:
-                    min_x = min(obj.rect.left for obj in objects)
-                    max_x = max(obj.rect.right for obj in objects)
-                else:
-                    min_x = 0
-                    max_x = WIDTH
+                min_x, max_x = level_bounds(objects)
                 level_width = max_x - min_x
                 continue
             else:
@@ -715,7 +1175,7 @@ def main(window):
             show_win_screen(window, bg_image, objects)
             run = False
             break
-        draw(window, background, bg_image, player, objects, offset_x)
+        draw(window, background, bg_image, player, objects, offset_x, renderer)
 
         # Camera: center player on screen but clamp to level bounds
         desired = player.rect.centerx - (WIDTH // 2)